@@ -1,12 +1,225 @@
+import asyncio
+import importlib.util
+import os
 import re
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import diskcache
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from dateutil.parser import parse
 from pytz import timezone
 from typing import Tuple, List
 
-def _get_api_plays(year : int, season : str, game_number : int) -> str:
+# on-disk cache for NHL API/HTML responses; finished games never change,
+# so entries can live forever and re-runs cost zero network. Set
+# NHL_CACHE=0 to bypass it, e.g. for freshly played games whose HTML
+# reports may still be corrected upstream
+_CACHE_ENABLED = os.environ.get('NHL_CACHE', '1') != '0'
+cache = diskcache.Cache(os.path.expanduser('~/.cache/nhl'))
+
+
+def _disk_memoize(func):
+    """
+    Apply the disk cache's memoization only when caching is enabled
+    """
+    if _CACHE_ENABLED:
+        return cache.memoize(expire=None)(func)
+    return func
+
+# shared session with keep-alive connection pooling so bulk pulls reuse
+# TCP/TLS connections instead of re-handshaking on every game; retries
+# with backoff are handled at the transport level by the adapter
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+_SESSION = requests.Session()
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+# valid season flags and their numeric codes in the NHL API, hoisted
+# to module scope so the hot fetch paths don't rebuild them per call
+_SEASONS = frozenset({'pre', 'regular', 'post', 'all-star'})
+_SEASON_ID = {
+    'pre' : '01',
+    'regular' : '02',
+    'post' : '03',
+    'all-star' : '04'
+}
+_SEASON_NAME = {v : k for k, v in _SEASON_ID.items()}
+
+# (td index, output column) pairs for the play-by-play report table;
+# td 3 holds the merged time elapsed/remaining cell and is split inline
+_FIELD_KEYS = (
+    (0, 'event_id'),
+    (1, 'period'),
+    (2, 'strength'),
+    (4, 'play_type'),
+    (5, 'play_description'),
+    (6, 'away_on_ice'),
+    (7, 'home_on_ice')
+)
+
+# output column order for the API play-by-play dataframe, frozen at
+# module scope so construction never falls back to column inference
+_API_PLAY_COLS = (
+    'game_id',
+    'game_date',
+    'away_team_id',
+    'away_team_code',
+    'home_team_id',
+    'home_team_code',
+    'event_id',
+    'play_type',
+    'play_type_id',
+    'play_description',
+    'period',
+    'time_elapsed',
+    'time_remaining',
+    'player1_id',
+    'player1_name',
+    'player2_id',
+    'player2_name'
+)
+
+# play types filtered out before the api/scrape join; they don't take
+# time off the clock & would mess up the join
+_FILTER_PLAYS = frozenset({
+    'GAME_SCHEDULED',
+    'PERIOD_READY',
+    'PERIOD_START',
+    'PERIOD_END',
+    'PERIOD_OFFICIAL',
+    'GAME_END',
+    'PENALTY',
+    'STOP'
+})
+
+# lookup table matching the HTML report's play abbreviations to the
+# NHL API play type ids
+_PLAY_LOOKUP = {
+    'FAC' : 'FACEOFF',
+    'GIVE' : 'GIVEAWAY',
+    'TAKE' : 'TAKEAWAY',
+    'HIT' : 'HIT',
+    'SHOT' : 'SHOT',
+    'MISS' : 'MISSED_SHOT',
+    'STOP' : 'STOP',
+    'BLOCK' : 'BLOCKED_SHOT',
+    'GOAL' : 'GOAL',
+    'PENL' : 'PENALTY',
+    'PEND' : 'PERIOD_END',
+    'PSTR' : 'PERIOD_START',
+    'GEND' : 'GAME_END'
+}
+
+# one C-level translation table covering both cell cleanups
+# (non-breaking space -> plain space, strip embedded newlines)
+_CLEAN_TBL = str.maketrans({'\xa0' : ' ', '\n' : None})
+
+# precompiled pattern pulling jersey numbers out of the on-ice cells
+_JERSEY_RE = re.compile(r'(\d+)')
+
+
+def _http_get_json(url : str) -> dict:
+    """
+    GET a URL over the shared session and decode the JSON body
+
+    Parameters
+    ----------
+    url : str
+        The URL to request
+
+    Returns
+    -------
+    dict
+        The decoded JSON response
+    """
+    # orjson's SIMD-accelerated parser is 2-3x faster than the stdlib
+    # json module on the deep feed-live payloads the NHL API returns
+    response = _SESSION.get(url, timeout=10)
+    return orjson.loads(response.content)
+
+
+def _http_get_bytes(url : str) -> bytes:
+    """
+    GET a URL over the shared session and return the raw body
+
+    Parameters
+    ----------
+    url : str
+        The URL to request
+
+    Returns
+    -------
+    bytes
+        The response body, undecoded
+    """
+    return _SESSION.get(url, timeout=10).content
+
+
+@lru_cache(maxsize=None)
+def _validate_and_encode(year : int, season : str, game_number : int) -> Tuple[str, str]:
+    """
+    Validate the (year, season, game_number) triple shared by all of
+    the NHL endpoints and encode it for URL building; raises
+    ValueError on bad input. Cached so the thousands of repeat calls a
+    season-scale pull makes collapse into a single dict hit each.
+
+    Returns
+    -------
+    Tuple[str, str]
+        The numeric season id and the zero-padded
+        '<season id><game number>' game code
+    """
+    if year < 1917:
+        raise ValueError('Year must be > 1917!')
+
+    if season not in _SEASONS:
+        raise ValueError(f'Season must be one of : {set(_SEASONS)}')
+
+    if (game_number < 0) or (game_number > 1313):
+        raise ValueError('Game ID must be between 0 - 1312')
+
+    # season is actually an integer in the API
+    season_id = _SEASON_ID[season]
+    return season_id, f'{season_id}{str(game_number).zfill(4)}'
+
+
+def _elapsed_seconds(time_elapsed : pd.Series) -> pd.Series:
+    """
+    Convert a Series of 'MM:SS' time-elapsed strings to integer seconds
+
+    Parameters
+    ----------
+    time_elapsed : pd.Series
+        Zero-padded 'MM:SS' strings
+
+    Returns
+    -------
+    pd.Series
+        The elapsed time in seconds as int64
+    """
+    # splitting zero rows yields a frame with no columns, so guard the
+    # empty case (a game can lose every play to the _FILTER_PLAYS mask)
+    if time_elapsed.empty:
+        return pd.Series([], index=time_elapsed.index, dtype='int64')
+
+    parts = time_elapsed.str.split(':', expand=True)
+    return parts[0].astype('int64') * 60 + parts[1].astype('int64')
+
+
+@_disk_memoize
+def _get_api_plays(year : int, season : str, game_number : int) -> dict:
     """
     Parameters 
     ----------
@@ -25,44 +238,27 @@ def _get_api_plays(year : int, season : str, game_number : int) -> str:
     
     Returns
     -------
-    str
-        The data as a JSON text format
+    dict
+        The decoded play-by-play JSON
     """
-    # input error-checking
-    if year < 1917:
-        raise ValueError('Year must be > 1917!')
-    
-    seasons = {'pre', 'regular', 'post', 'all-star'}
-    if season not in seasons:
-        raise ValueError(f'Season must be one of : {seasons}')
-    
-    if (game_number < 0) or (game_number > 1313):
-        raise ValueError('Game ID must be between 0 - 1312')
-
-    # season is actually an integer in the API
-    season_dict = {
-        'pre' : '01',
-        'regular' : '02',
-        'post' : '03',
-        'all-star' : '04'
-    }
-    season : str = season_dict.get(season)
+    # input error-checking & URL encoding
+    _, game_code = _validate_and_encode(year, season, game_number)
 
     # game id is needed for the URL in the API
-    game_id = f'{year}{season}{str(game_number).zfill(4)}'
+    game_id = f'{year}{game_code}'
     url = f'https://statsapi.web.nhl.com/api/v1/game/{game_id}/feed/live'
-    json : str = requests.get(url).json()
+    json_data : dict = _http_get_json(url)
 
-    return json
+    return json_data
 
 
 
-def _parse_api_plays(json : str) -> pd.DataFrame:
+def _parse_api_plays(json_data : dict) -> pd.DataFrame:
     """
     Parameters
     ----------
-    json : str
-        A JSON text of the play-by-play data
+    json_data : dict
+        The decoded play-by-play JSON
 
     Returns
     -------
@@ -70,79 +266,105 @@ def _parse_api_plays(json : str) -> pd.DataFrame:
         A dataframe of the parsed JSON
     """ 
     # get list of all plays from the game
-    play_list = json.get('liveData').get('plays').get('allPlays')
+    play_list = json_data.get('liveData').get('plays').get('allPlays')
 
-    get_date_obj : datetime = parse(json.get('gameData').get('datetime').get('dateTime'))
+    # scheduled/postponed games carry no plays yet; hand back a
+    # well-formed empty frame instead of tripping the astype below
+    if not play_list:
+        return pd.DataFrame(columns=list(_API_PLAY_COLS))
+
+    get_date_obj : datetime = parse(json_data.get('gameData').get('datetime').get('dateTime'))
     date_central : datetime = get_date_obj.astimezone(timezone('US/Central'))
     game_date : str = date_central.strftime('%Y-%m-%d')
 
     # get game information that does not change by play
-    game_id = json.get('gameData').get('game').get('pk')
-    visiting_team_id = json.get('gameData').get('teams').get('away').get('id')
-    visiting_team_code = json.get('gameData').get('teams').get('away').get('triCode')
-    home_team_id = json.get('gameData').get('teams').get('home').get('id')
-    home_team_code = json.get('gameData').get('teams').get('home').get('triCode')
-
-    plays = {
-        'game_id' : [],
-        'game_date' : [],
-        'away_team_id' : [],
-        'away_team_code' : [],
-        'home_team_id' : [],
-        'home_team_code' : [],
-        'event_id' : [],
-        'play_type' : [],
-        'play_type_id' : [],
-        'play_description' : [],
-        'period' : [],
-        'time_elapsed' : [],
-        'time_remaining' : [],
-        'player1_id' : [],
-        'player1_name' : [],
-        'player2_id' : [],
-        'player2_name' : []
-    }
-
+    game_id = json_data.get('gameData').get('game').get('pk')
+    visiting_team_id = json_data.get('gameData').get('teams').get('away').get('id')
+    visiting_team_code = json_data.get('gameData').get('teams').get('away').get('triCode')
+    home_team_id = json_data.get('gameData').get('teams').get('home').get('id')
+    home_team_code = json_data.get('gameData').get('teams').get('home').get('triCode')
+
+    # flatten the nested play records into columns in a single
+    # pd.json_normalize pass instead of growing 20 Python lists
+    # play-by-play; pandas builds the columnar blocks directly
+    plays = pd.json_normalize(play_list, sep='.')
+    plays = plays.rename(columns={
+        'about.eventId' : 'event_id',
+        'result.event' : 'play_type',
+        'result.eventTypeId' : 'play_type_id',
+        'result.description' : 'play_description',
+        'about.period' : 'period',
+        'about.periodTime' : 'time_elapsed',
+        'about.periodTimeRemaining' : 'time_remaining'
+    })
+
+    # pull the first (and, where present, second) player out of the
+    # nested players list; some plays carry no players at all. This is
+    # the one remaining per-play Python loop, so bind the append as a
+    # local (LOAD_FAST vs LOAD_ATTR) and index with [] where the API
+    # guarantees the key instead of paying a .get dispatch per field
+    player_info = []
+    append_info = player_info.append
     for play in play_list:
-        plays['game_id'].append(game_id)
-        plays['game_date'].append(game_date)
-        plays["away_team_id"].append(visiting_team_id)
-        plays["away_team_code"].append(visiting_team_code)
-        plays["home_team_id"].append(home_team_id)
-        plays["home_team_code"].append(home_team_code)
-        plays['event_id'].append(play.get('about').get('eventId'))
-        plays['play_type'].append(play.get('result').get('event'))
-        plays['play_type_id'].append(play.get('result').get('eventTypeId'))
-        plays['play_description'].append(play.get('result').get('description'))
-        plays['period'].append(play.get('about').get('period'))
-        plays['time_elapsed'].append(play.get('about').get('periodTime'))
-        plays['time_remaining'].append(play.get('about').get('periodTimeRemaining'))
-        
-        if play.get('players') is None:
-            # add None type to the list to make all the lists the same length for the Pandas conversion to DataFrame
-            plays['player1_id'].append(None)
-            plays['player1_name'].append(None)
-            plays['player2_id'].append(None)
-            plays['player2_name'].append(None)
+        players = play.get('players')
+        if players is None:
+            append_info((None, None, None, None))
+        elif len(players) == 2:
+            player1 = players[0]['player']
+            player2 = players[1]['player']
+            append_info((player1['id'], player1['fullName'],
+                         player2['id'], player2['fullName']))
         else:
-            # add Player 1 info
-            player1 = play.get('players')[0]
-            plays['player1_id'].append(player1.get('player').get('id'))
-            plays['player1_name'].append(player1.get('player').get('fullName'))
-            
-            # check if there is a second player in the play, if not add None type to the list
-            if len(play.get('players')) == 2:
-                player2 = play.get('players')[1]
-                plays['player2_id'].append(player2.get('player').get('id'))
-                plays['player2_name'].append(player2.get('player').get('fullName'))            
-            else:
-                plays['player2_id'].append(None)
-                plays['player2_name'].append(None)        
-        
-    return pd.DataFrame(plays)
-
-
-def _get_players_on_ice(year : int, season : str, game_number : int) -> Tuple[str]:
+            player1 = players[0]['player']
+            append_info((player1['id'], player1['fullName'], None, None))
+
+    if player_info:
+        player1_id, player1_name, player2_id, player2_name = map(list, zip(*player_info))
+    else:
+        player1_id = player1_name = player2_id = player2_name = []
+
+    # constant game-level columns broadcast as scalars (zero allocation)
+    plays = plays.assign(
+        game_id=game_id,
+        game_date=game_date,
+        away_team_id=visiting_team_id,
+        away_team_code=visiting_team_code,
+        home_team_id=home_team_id,
+        home_team_code=home_team_code,
+        player1_id=player1_id,
+        player1_name=player1_name,
+        player2_id=player2_id,
+        player2_name=player2_name
+    )
+
+    # nail the dtypes down at construction; the nullable Int types
+    # absorb the None player slots without falling back to object
+    # columns, the low-cardinality codes become categoricals (int8
+    # codes over a shared categories array), and the remaining text
+    # columns go to contiguous arrow-backed string storage instead of
+    # one PyObject per cell
+    plays = plays.astype({
+        'event_id' : 'Int64',
+        'period' : 'Int8',
+        'player1_id' : 'Int64',
+        'player2_id' : 'Int64',
+        'game_date' : 'string[pyarrow]',
+        'away_team_code' : 'category',
+        'home_team_code' : 'category',
+        'play_type' : 'category',
+        'play_type_id' : 'category',
+        'play_description' : 'string[pyarrow]',
+        'time_elapsed' : 'string[pyarrow]',
+        'time_remaining' : 'string[pyarrow]',
+        'player1_name' : 'string[pyarrow]',
+        'player2_name' : 'string[pyarrow]'
+    })
+
+    return plays[list(_API_PLAY_COLS)]
+
+
+@_disk_memoize
+def _get_players_on_ice(year : int, season : str, game_number : int) -> Tuple[bytes, int, str]:
     """
     Parameters 
     ----------
@@ -161,62 +383,127 @@ def _get_players_on_ice(year : int, season : str, game_number : int) -> Tuple[st
     
     Returns
     -------
-    str
-        The data in HTML text format
+    Tuple[bytes, int, str]
+        The raw HTML report (left undecoded for lxml's C parser), the
+        season starting year, and the '<season id><game number>'
+        game id
     """
-    # input error-checking
-    if year < 1917:
-        raise ValueError('Year must be > 1917!')
-    
-    seasons = {'pre', 'regular', 'post', 'all-star'}
-    if season not in seasons:
-        raise ValueError(f'Season must be one of : {seasons}')
-    
-    if (game_number < 0) or (game_number > 1313):
-        raise ValueError('Game ID must be between 0 - 1312')
-
-    # season is actually an integer in the API
-    season_dict = {
-        'pre' : '01',
-        'regular' : '02',
-        'post' : '03',
-        'all-star' : '04'
-    }
-    season : str = season_dict.get(season)
+    # input error-checking & URL encoding
+    _, game_id = _validate_and_encode(year, season, game_number)
 
     # the URL requires year as 20182019 for example
-    year_id : str = f'{year}{int(year) + 1}'    
-    game_id : str = f'{season}{str(game_number).zfill(4)}'
+    year_id : str = f'{year}{int(year) + 1}'
 
     url = f'http://www.nhl.com/scores/htmlreports/{year_id}/PL{game_id}.HTM'
-    response = requests.get(url)
+    html = _http_get_bytes(url)
 
-    return response.text, year, game_id
+    return html, year, game_id
 
 
-def _parse_players_on_ice(html : str, year : int, game_id : str) -> pd.DataFrame:
+def _stream_players_on_ice(year : int, season : str, game_number : int):
     """
+    Stream the HTML play-by-play report row by row
+
+    Parses the report incrementally with etree.iterparse over the
+    still-downloading response body, so parsing overlaps the network
+    transfer and peak memory stays at one <tr> subtree instead of the
+    whole document. The eager _get_players_on_ice /
+    _parse_players_on_ice pair remains the default path; this is for
+    season-scale consumers that reduce rows on the fly.
+
     Parameters
     ----------
-    html : str
-        An HTML text of the play-by-play data
-    
     year : int
         The season starting year of the game
         Example: 2018 (for the 2018-2019 season)
-    
+
+    season : str
+        The season "flag"; must be one of
+        {'pre', 'regular', 'post', 'all-star'}
+
+    game_number : int
+        The game number. Valid range:
+            * 1 - 1271 (pre year 2020)
+            * 1 - 1312 (post year 2020; with the addition of Seattle Hockey Team)
+
+    Yields
+    ------
+    dict
+        One play per dict, keyed like the _parse_players_on_ice
+        columns (event_id, period, strength, time_elapsed,
+        time_remaining, play_type, play_description, away_on_ice,
+        home_on_ice)
+    """
+    # input error-checking & URL encoding
+    _, game_id = _validate_and_encode(year, season, game_number)
+
+    # the URL requires year as 20182019 for example
+    year_id : str = f'{year}{int(year) + 1}'
+    url = f'http://www.nhl.com/scores/htmlreports/{year_id}/PL{game_id}.HTM'
+
+    response = _SESSION.get(url, timeout=10, stream=True)
+    response.raise_for_status()
+    # urllib3 hands the raw stream over undecoded; tell it to undo any
+    # gzip/deflate transfer encoding, otherwise iterparse silently
+    # finds no <tr> elements in the compressed bytes
+    response.raw.decode_content = True
+    context = etree.iterparse(response.raw, events=('end',), tag='tr', html=True)
+
+    seen = 0
+    for _, row in context:
+        if row.get('class') != 'evenColor':
+            continue
+
+        # keep parity with the trs[4:] slice of the eager parser
+        seen += 1
+        if seen <= 4:
+            row.clear()
+            continue
+
+        texts = [''.join(cell.itertext()) for cell in row.findall('td')]
+        play = {key : texts[i].translate(_CLEAN_TBL) for i, key in _FIELD_KEYS}
+
+        # the time elapsed & time remaining columns get merged
+        # into one cell during the scrape, so split them here
+        time_text = texts[3]
+        delimiter = time_text.find(':') + 3
+        play['time_elapsed'] = time_text[0:delimiter].zfill(5)
+        play['time_remaining'] = time_text[delimiter:].zfill(5)
+
+        # drop the parsed subtree to keep the footprint bounded
+        row.clear()
+        yield play
+
+
+def _parse_players_on_ice(html : bytes, year : int, game_id : str, roster_data : pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Parameters
+    ----------
+    html : bytes
+        The raw HTML of the play-by-play data
+
+    year : int
+        The season starting year of the game
+        Example: 2018 (for the 2018-2019 season)
+
     game_id : str
         The id for the game, which is a combination
         of the season id and game id
 
+    roster_data : pd.DataFrame, optional
+        A pre-fetched roster as returned by get_roster();
+        fetched on demand when not provided
+
     Returns
     -------
     pd.DataFrame
         A dataframe of the parsed HTML
     """
-    soup = BeautifulSoup(html, 'lxml')
+    # parse with lxml directly; skipping the BeautifulSoup Tag wrapper
+    # layer makes this the cheapest way to walk a fixed-layout table
+    doc = lxml_html.fromstring(html)
     # trs - table rows in an HTML table
-    trs = soup.find_all('tr', class_='evenColor')
+    trs = doc.xpath("//tr[@class='evenColor']")
     # set up dictionary to hold data lists before converting to Pandas dataframe
     play_by_play_data = {
         'event_id' : [],
@@ -230,92 +517,50 @@ def _parse_players_on_ice(html : str, year : int, game_id : str) -> pd.DataFrame
         'home_on_ice' : []
     }
 
-    # create keys for HTML table data locations
-    key_lookup = {
-        1 : 'event_id',
-        3 : 'period',
-        5 : 'strength',
-        7 : 'time_elapsed',
-        8 : 'time_remaining',
-        9 : 'play_type',
-        11 : 'play_description',
-        13 : 'away_on_ice',
-        15 : 'home_on_ice'
-    }
-
-    # create lookup table for plays to match the NHL API data
-    play_lookup = {
-        'FAC' : 'FACEOFF',
-        'GIVE' : 'GIVEAWAY',
-        'TAKE' : 'TAKEAWAY',
-        'HIT' : 'HIT',
-        'SHOT' : 'SHOT',
-        'MISS' : 'MISSED_SHOT',
-        'STOP' : 'STOP',
-        'BLOCK' : 'BLOCKED_SHOT',
-        'GOAL' : 'GOAL',
-        'PENL' : 'PENALTY',
-        'PEND' : 'PERIOD_END',
-        'PSTR' : 'PERIOD_START',
-        'GEND' : 'GAME_END'
-    }
-
-    # scrape data from HTML table
-    pattern = r'\n+'
+    # scrape data from the HTML table in a single pass per row;
+    # cleaning goes through one translate call per cell instead of
+    # chained replace/regex passes
     for row in trs[4:]:
-        for i, cell in enumerate(row):     
-            if i in (1, 3, 5, 9, 11, 13, 15):
-                text = cell.text.replace('\xa0', ' ')
-                text = re.sub(pattern, '', text)
-                
-                key = key_lookup.get(i)
-                play_by_play_data[key].append(text)
-
-    # scrape time elapsed data from HTML table separately
-    # we need to do this because the time elapsed & time
-    # remaining columns get merged into one during the scrape
-    for row in trs[4:]:
-        for i, cell in enumerate(row):     
-            if i == 7:
-                text = cell.text.replace('\xa0', ' ')
-                text = re.sub(pattern, '', text)
-                
-                delimiter = cell.text.find(':') + 3
-                text_expired = cell.text[0:delimiter].zfill(5)
-                text_remaining = cell.text[delimiter:].zfill(5)
-
-                key_expired = key_lookup.get(i)
-                key_remaining = key_lookup.get(i + 1)
-                play_by_play_data[key_expired].append(text_expired)
-                play_by_play_data[key_remaining].append(text_remaining)
+        cells = row.findall('td')
+        for i, key in _FIELD_KEYS:
+            play_by_play_data[key].append(cells[i].text_content().translate(_CLEAN_TBL))
+
+        # the time elapsed & time remaining columns get merged
+        # into one cell during the scrape, so split them here
+        time_text = cells[3].text_content()
+        delimiter = time_text.find(':') + 3
+        play_by_play_data['time_elapsed'].append(time_text[0:delimiter].zfill(5))
+        play_by_play_data['time_remaining'].append(time_text[delimiter:].zfill(5))
 
     # convert data to Pandas dataframe
     plays_scrape = pd.DataFrame(play_by_play_data)
 
-    # split home on ice column into individual columns
-    home_on_ice = ( plays_scrape['home_on_ice']
-                    .str.strip()
-                    .str.replace('[aA-zZ]', '')
-                    .str.split(' ', expand=True) )
-    home_cols = ['home_1', 'home_2', 'home_3', 'home_4', 'home_5', 'home_6']
-    home_on_ice.columns = home_cols
+    # pull the jersey numbers out of both on-ice columns with one
+    # extractall scan: stack away on top of home, scan the 2N rows
+    # once, then slice the halves back apart. \d+ ignores the
+    # surrounding position letters outright, replacing the old
+    # strip/replace/split chain (whose '[aA-zZ]' class also matched
+    # far more than letters)
+    n_rows = len(plays_scrape)
+    both_on_ice = pd.concat([plays_scrape['away_on_ice'],
+                             plays_scrape['home_on_ice']],
+                            ignore_index=True)
+    on_ice = ( both_on_ice
+               .str.extractall(_JERSEY_RE)[0]
+               .unstack(level=-1)
+               .reindex(index=range(2 * n_rows), columns=range(6)) )
 
-    # split away on ice column into individual columns
-    away_on_ice = ( plays_scrape['away_on_ice']
-                    .str.strip()
-                    .str.replace('[aA-zZ]', '')
-                    .str.split(' ', expand=True) )
     away_cols = ['away_1', 'away_2', 'away_3', 'away_4', 'away_5', 'away_6']
-    away_on_ice.columns = away_cols
+    home_cols = ['home_1', 'home_2', 'home_3', 'home_4', 'home_5', 'home_6']
 
     # add the on ice player columns
-    plays_scrape[away_cols] = away_on_ice
-    plays_scrape[home_cols] = home_on_ice
+    plays_scrape[away_cols] = on_ice.iloc[:n_rows].to_numpy()
+    plays_scrape[home_cols] = on_ice.iloc[n_rows:].to_numpy()
 
     # add game id to the df
     plays_scrape['game_id'] = game_id
 
-    plays_scrape['play_type_id'] = plays_scrape['play_type'].map(play_lookup)
+    plays_scrape['play_type_id'] = plays_scrape['play_type'].map(_PLAY_LOOKUP)
 
     # reorder columns
     cols = ['game_id',
@@ -332,44 +577,59 @@ def _parse_players_on_ice(html : str, year : int, game_id : str) -> pd.DataFrame
             'away_1','away_2','away_3','away_4','away_5','away_6',
             'home_1','home_2','home_3','home_4','home_5','home_6']
     plays_scrape = plays_scrape[cols]
-    plays_scrape['period'] = pd.to_numeric(plays_scrape['period'])
-
-    # get roster data to convert jersey numbers to player_id
-    # create dictionary to convert season from numerical index
-    # back to human-friendly index
-    season_dict = {
-        '01' : 'pre',
-        '02' : 'regular',
-        '03' : 'post',
-        '04' : 'all-star'
-    }
-    # get season number from game_id then convert using season_dict
-    season = game_id[:2]
-    season : str = season_dict.get(season)
-    game_number = int(game_id[2:])
-    
-    # pull roster data to get player IDs to add to dataframe
-    roster_data = get_roster(year, season, game_number)
+    # match the Int8 period dtype of the API frame so the later merge
+    # joins on identically-typed keys, and store the short text
+    # columns as arrow-backed strings like the API frame does (the
+    # on-ice columns stay object - they are rewritten to player ids)
+    plays_scrape['period'] = pd.to_numeric(plays_scrape['period']).astype('Int8')
+    plays_scrape = plays_scrape.astype({
+        'strength' : 'category',
+        'time_elapsed' : 'string[pyarrow]',
+        'time_remaining' : 'string[pyarrow]',
+        'play_type' : 'category',
+        'play_type_id' : 'category',
+        'play_description' : 'string[pyarrow]'
+    })
+
+    if roster_data is None:
+        # pull roster data to get player IDs; convert the season from
+        # its numerical index back to the human-friendly flag first
+        season : str = _SEASON_NAME[game_id[:2]]
+        game_number = int(game_id[2:])
+        roster_data = get_roster(year, season, game_number)
 
     # add player ID to dataframe
-    # create dictionary to add player IDs
-    roster_data['player_guid'] = roster_data['home_away'] + roster_data['jersey_number']
-    player_dict = roster_data.set_index('player_guid').to_dict()['player_id']
-
-    # create guid columns for scraped data
-    plays_scrape.update(plays_scrape.loc[:,'away_1':'away_6'].apply(lambda x: 'away' + x))
-    plays_scrape.update(plays_scrape.loc[:,'home_1':'home_6'].apply(lambda x: 'home' + x))
-
-    # update scraped data with player IDs
-    plays_scrape.update(plays_scrape.loc[:,'away_1':'away_6'].replace(player_dict))
-    plays_scrape.update(plays_scrape.loc[:,'home_1':'home_6'].replace(player_dict))
+    # build a (side, jersey) -> player_id lookup table; jersey numbers
+    # are bounded by 98, so a tiny dense array indexed by side code
+    # and jersey replaces the guid-string + dict-hash mapping
+    lut = np.full((2, 101), None, dtype=object)
+    jerseys = pd.to_numeric(roster_data['jersey_number'], errors='coerce')
+    has_jersey = jerseys.notna().to_numpy()
+    side_codes = (roster_data['home_away'] == 'home').to_numpy().astype(np.int8)
+    lut[side_codes[has_jersey],
+        jerseys.to_numpy()[has_jersey].astype(np.int64)] = \
+        roster_data['player_id'].to_numpy()[has_jersey]
+
+    # update scraped data with player IDs in one vectorized gather per
+    # side; index 100 is a sentinel for empty cells, and anything the
+    # lookup misses keeps its scraped jersey value as before
+    for side_code, side_cols in ((0, away_cols), (1, home_cols)):
+        jersey_idx = ( plays_scrape[side_cols]
+                       .apply(pd.to_numeric, errors='coerce')
+                       .fillna(100)
+                       .to_numpy()
+                       .astype(np.int64) )
+        mapped = lut[side_code, jersey_idx]
+        # elementwise None comparison on the object array
+        unmatched = np.equal(mapped, None)
+        plays_scrape[side_cols] = np.where(unmatched, plays_scrape[side_cols], mapped)
 
     return plays_scrape
 
 
 def get_roster(year : int, season : str, game_number : int) -> pd.DataFrame:
     """
-    Parameters 
+    Parameters
     ----------
     year : int
         The season starting year of the game
@@ -383,78 +643,70 @@ def get_roster(year : int, season : str, game_number : int) -> pd.DataFrame:
         The game number. Valid range:
             * 1 - 1271 (pre year 2020)
             * 1 - 1312 (post year 2020; with the addition of Seattle Hockey Team)
-    
+
     Returns
     -------
     pd.DataFrame
         The data as a pandas DataFrame
     """
-    # input error-checking
-    if year < 1917:
-        raise ValueError('Year must be > 1917!')
-    
-    seasons = {'pre', 'regular', 'post', 'all-star'}
-    if season not in seasons:
-        raise ValueError(f'Season must be one of : {seasons}')
-    
-    if (game_number < 0) or (game_number > 1313):
-        raise ValueError('Game ID must be between 0 - 1312')
+    # the memoized frame is shared between calls, so hand
+    # out a copy in case a caller mutates it
+    return _get_roster(year, season, game_number).copy()
 
-    # season is actually an integer in the API
-    season_dict = {
-        'pre' : '01',
-        'regular' : '02',
-        'post' : '03',
-        'all-star' : '04'
-    }
-    season : str = season_dict.get(season)
+
+@lru_cache(maxsize=4096)
+@_disk_memoize
+def _get_roster(year : int, season : str, game_number : int) -> pd.DataFrame:
+    """
+    Cached implementation behind get_roster; the lru_cache makes
+    repeat lookups within a session a dict hit, with the disk cache
+    underneath for cross-session hits
+    """
+    # input error-checking & URL encoding
+    _, game_code = _validate_and_encode(year, season, game_number)
 
     # game id is needed for the URL in the API
-    game_id = f'{year}{season}{str(game_number).zfill(4)}'
+    game_id = f'{year}{game_code}'
     url = f'https://statsapi.web.nhl.com/api/v1/game/{game_id}/boxscore'
-    json : str = requests.get(url).json()
-
-    teams_list : List[str] = json.get('teams')
-    players = {
-        'home_away' : [],
-        'team_id' : [],
-        'player_id' : [],
-        'player_name' : [],
-        'player_position' : [],
-        'jersey_number' : []
-    }
+    json_data : dict = _http_get_json(url)
 
-    for team in teams_list:
-        for player in teams_list.get(team).get('players'):
-            players['home_away'].append(team)
-            (players['team_id']
-                .append(teams_list
-                    .get(team)
-                    .get('team')
-                    .get('id')))
-            players['player_id'].append(player)
-            (players['player_name']
-                .append(teams_list
-                    .get(team)
-                    .get('players')
-                    .get(player)
-                    .get('person')
-                    .get('fullName')))
-            (players['player_position']
-                .append(teams_list
-                    .get(team)
-                    .get('players')
-                    .get(player)
-                    .get('position')
-                    .get('abbreviation')))
-            (players['jersey_number']
-                .append(teams_list
-                    .get(team)
-                    .get('players')
-                    .get(player)
-                    .get('jerseyNumber')))
-        
-    players = pd.DataFrame(players)
+    return _parse_roster(json_data)
+
+
+def _parse_roster(json_data : dict) -> pd.DataFrame:
+    """
+    Parameters
+    ----------
+    json_data : dict
+        The decoded boxscore JSON for a game
+
+    Returns
+    -------
+    pd.DataFrame
+        The roster as a pandas DataFrame
+    """
+    # walk each team's players exactly once, binding the intermediate
+    # dicts as locals instead of re-chasing a four-level .get chain
+    # per field, and build the frame in one shot from the row tuples
+    rows = []
+    for side, team_blob in json_data.get('teams').items():
+        team_id = team_blob['team']['id']
+        for player_id, player_blob in team_blob['players'].items():
+            rows.append((side,
+                         team_id,
+                         player_id,
+                         player_blob['person']['fullName'],
+                         player_blob['position']['abbreviation'],
+                         player_blob.get('jerseyNumber')))
+
+    players = pd.DataFrame.from_records(rows, columns=[
+        'home_away',
+        'team_id',
+        'player_id',
+        'player_name',
+        'player_position',
+        'jersey_number'
+    ])
     return players
 
 
@@ -480,33 +732,26 @@ def _combine_api_scrape_data(api_df : pd.DataFrame, scrape_df : pd.DataFrame, ye
     pd.DataFrame
         The combined data as a pandas DataFrame
     """
-    # create updated game_id in scrape_df to match
-    # the game_id column in api_df
-    scrape_df['game_id'] = (str(year) + scrape_df['game_id']).astype(int)
-
-    # create list of play types to filter out
-    filter_plays = [
-        'GAME_SCHEDULED',
-        'PERIOD_READY',
-        'PERIOD_START',
-        'PERIOD_END',
-        'PERIOD_OFFICIAL',
-        'GAME_END',
-        'PENALTY',
-        'STOP'
-        ]
+    # create updated game_id in scrape_df to match the game_id column
+    # in api_df; the scraped id is always 6 digits (2-digit season +
+    # 4-digit game number), so stay in integer space
+    scrape_df['game_id'] = year * 10 ** 6 + scrape_df['game_id'].astype(int)
 
     # filter out unnecessary plays from both dfs
-    # we need to filter these out since they don't take time off
-    # the clock & it will mess up the join
-    api_df = api_df[~api_df['play_type_id'].isin(filter_plays)]
-    scrape_df = scrape_df[~scrape_df['play_type_id'].isin(filter_plays)]
+    api_df = api_df[~api_df['play_type_id'].isin(_FILTER_PLAYS)]
+    scrape_df = scrape_df[~scrape_df['play_type_id'].isin(_FILTER_PLAYS)]
+
+    # replace the zero-padded time string with integer seconds on both
+    # sides so the merge dispatches to the int64 hash-join kernel
+    # instead of hashing Python strings row by row
+    api_df = api_df.assign(elapsed_s=_elapsed_seconds(api_df['time_elapsed']))
+    scrape_df = scrape_df.assign(elapsed_s=_elapsed_seconds(scrape_df['time_elapsed']))
 
     # create list of columns to keep in scrape_df
     scrape_cols = [
         'game_id',
         'period',
-        'time_elapsed',
+        'elapsed_s',
         'away_1','away_2','away_3','away_4','away_5','away_6',
         'home_1','home_2','home_3','home_4','home_5','home_6'
     ]
@@ -514,11 +759,195 @@ def _combine_api_scrape_data(api_df : pd.DataFrame, scrape_df : pd.DataFrame, ye
     # filter out un-needed columns
     scrape_df = scrape_df[scrape_cols]
 
+    # defragment both frames before the merge: the boolean filtering
+    # above leaves sliced blocks behind, and a fresh copy gives the
+    # join keys contiguous per-column 1D arrays for the hash join
+    api_df = api_df.copy()
+    scrape_df = scrape_df.copy()
+
     # join the dataframes together
-    combined_df = pd.merge(left=api_df, right= scrape_df, on = ['game_id', 'period', 'time_elapsed'])
-    
+    combined_df = pd.merge(left=api_df, right=scrape_df,
+                           on=['game_id', 'period', 'elapsed_s'],
+                           sort=False)
+    combined_df = combined_df.drop(columns=['elapsed_s'])
+
     return combined_df
 
+def fetch_game(year : int, season : str, game_number : int) -> pd.DataFrame:
+    """
+    Fetch and combine the API and HTML play-by-play
+    data for a single game
+
+    Parameters
+    ----------
+    year : int
+        The season starting year of the game
+        Example: 2018 (for the 2018-2019 season)
+
+    season : str
+        The season "flag"; must be one of
+        {'pre', 'regular', 'post', 'all-star'}
+
+    game_number : int
+        The game number. Valid range:
+            * 1 - 1271 (pre year 2020)
+            * 1 - 1312 (post year 2020; with the addition of Seattle Hockey Team)
+
+    Returns
+    -------
+    pd.DataFrame
+        The combined data as a pandas DataFrame
+    """
+    # the API JSON and the HTML report are independent round trips,
+    # so fire both at once instead of back-to-back; this roughly
+    # halves the per-game network wait even without fetch_season's
+    # cross-game parallelism
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        api_future = executor.submit(_get_api_plays, year, season, game_number)
+        html_future = executor.submit(_get_players_on_ice, year, season, game_number)
+        api_json = api_future.result()
+        html, year, game_id = html_future.result()
+
+    api_df = _parse_api_plays(api_json)
+    scrape_df = _parse_players_on_ice(html, year, game_id)
+
+    return _combine_api_scrape_data(api_df, scrape_df, year)
+
+
+async def fetch_game_async(year : int, season : str, game_number : int) -> pd.DataFrame:
+    """
+    Asynchronous variant of fetch_game
+
+    The play-by-play API, the HTML report and the boxscore roster for
+    one game are independent, so the three requests are issued
+    concurrently (over a single HTTP/2 connection when the httpx[http2]
+    extra is installed and the server supports it) instead of
+    back-to-back; run via asyncio.run(...) or
+    gather several games from an event loop. fetch_game remains the
+    synchronous entry point for callers not using asyncio.
+
+    Parameters
+    ----------
+    year : int
+        The season starting year of the game
+        Example: 2018 (for the 2018-2019 season)
+
+    season : str
+        The season "flag"; must be one of
+        {'pre', 'regular', 'post', 'all-star'}
+
+    game_number : int
+        The game number. Valid range:
+            * 1 - 1271 (pre year 2020)
+            * 1 - 1312 (post year 2020; with the addition of Seattle Hockey Team)
+
+    Returns
+    -------
+    pd.DataFrame
+        The combined data as a pandas DataFrame
+    """
+    # input error-checking & URL encoding
+    _, html_game_id = _validate_and_encode(year, season, game_number)
+
+    game_id = f'{year}{html_game_id}'
+    year_id = f'{year}{int(year) + 1}'
+
+    api_url = f'https://statsapi.web.nhl.com/api/v1/game/{game_id}/feed/live'
+    roster_url = f'https://statsapi.web.nhl.com/api/v1/game/{game_id}/boxscore'
+    html_url = f'http://www.nhl.com/scores/htmlreports/{year_id}/PL{html_game_id}.HTM'
+
+    # HTTP/2 needs the optional h2 package (pip install httpx[http2]);
+    # fall back to HTTP/1.1 when it isn't installed rather than
+    # crashing at client construction
+    use_http2 = importlib.util.find_spec('h2') is not None
+    async with httpx.AsyncClient(http2=use_http2, timeout=10) as client:
+        api_resp, html_resp, roster_resp = await asyncio.gather(
+            client.get(api_url),
+            client.get(html_url),
+            client.get(roster_url)
+        )
+
+    api_df = _parse_api_plays(orjson.loads(api_resp.content))
+    roster_df = _parse_roster(orjson.loads(roster_resp.content))
+    scrape_df = _parse_players_on_ice(html_resp.content, year, html_game_id,
+                                      roster_data=roster_df)
+
+    return _combine_api_scrape_data(api_df, scrape_df, year)
+
+
+def fetch_season(year : int, season : str, n_games : int = 1271, max_workers : int = 16) -> List[pd.DataFrame]:
+    """
+    Fetch all games of a season concurrently
+
+    The per-game work is network I/O-bound, so fanning the fetches out
+    over a thread pool on the shared session overlaps the request round
+    trips; already-cached games are served from disk without a request.
+
+    Parameters
+    ----------
+    year : int
+        The season starting year of the game
+        Example: 2018 (for the 2018-2019 season)
+
+    season : str
+        The season "flag"; must be one of
+        {'pre', 'regular', 'post', 'all-star'}
+
+    n_games : int
+        The number of games in the season
+            * 1271 (pre year 2020)
+            * 1312 (post year 2020; with the addition of Seattle Hockey Team)
+
+    max_workers : int
+        The number of threads fetching games concurrently
+
+    Returns
+    -------
+    List[pd.DataFrame]
+        One combined dataframe per game, in game-number order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(partial(fetch_game, year, season),
+                                    range(1, n_games + 1)))
+    return results
+
+
+def get_plays_batch(year : int, season : str, game_numbers : List[int], max_workers : int = 16) -> List[pd.DataFrame]:
+    """
+    Fetch and parse the API play-by-play for many games concurrently
+
+    Unlike fetch_season this only hits the feed-live endpoint (no HTML
+    report or roster), which is all that is needed for analyses that
+    don't require the on-ice players.
+
+    Parameters
+    ----------
+    year : int
+        The season starting year of the game
+        Example: 2018 (for the 2018-2019 season)
+
+    season : str
+        The season "flag"; must be one of
+        {'pre', 'regular', 'post', 'all-star'}
+
+    game_numbers : List[int]
+        The game numbers to fetch
+
+    max_workers : int
+        The number of threads fetching games concurrently
+
+    Returns
+    -------
+    List[pd.DataFrame]
+        One parsed plays dataframe per game, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        payloads = list(executor.map(partial(_get_api_plays, year, season),
+                                     game_numbers))
+    return [_parse_api_plays(payload) for payload in payloads]
+
+
 # TODO formalize functions to match SQL tables' column names
 
 if __name__ == "__main__":
+    pass
@@ -66,7 +66,8 @@ def create_tables(database_name):
         """,
         """
         CREATE TABLE IF NOT EXISTS plays (
-            game_id INT PRIMARY KEY,
+            play_pk INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_id INT NOT NULL,
             period INT,
             time_elapsed VARCHAR,
             home_players_on_ice INT,
@@ -106,12 +107,56 @@ def create_tables(database_name):
         """
     ]
 
+    # index the join/filter columns so lookups against players and
+    # per-game scans don't fall back to full-table scans
+    index_statements = [
+        "CREATE INDEX IF NOT EXISTS idx_plays_game ON plays(game_id, period, time_elapsed);",
+        "CREATE INDEX IF NOT EXISTS idx_plays_player_1 ON plays(player_1_id);",
+        "CREATE INDEX IF NOT EXISTS idx_plays_player_2 ON plays(player_2_id);"
+    ]
+    for side in ('home', 'away'):
+        for i in range(1, 7):
+            index_statements.append(
+                f"CREATE INDEX IF NOT EXISTS idx_plays_{side}_{i} "
+                f"ON plays({side}_player_{i}_id);"
+            )
+
     with sqlite3.connect(database_name) as conn:
         cursor = conn.cursor()
-        
+
+        # WAL with relaxed sync and in-memory temp storage makes the
+        # subsequent bulk loads several times faster than the default
+        # rollback-journal mode
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+
         print('Creating tables... ', end='')
-        for stmnt in statements:
+        for stmnt in statements + index_statements:
             cursor.execute(stmnt)
-            
+
         print('Done.')
     return
+
+
+def bulk_insert(conn, table, df):
+    """
+    Bulk-insert a pandas DataFrame into an existing table
+
+    A single executemany over the frame's row tuples inside one
+    transaction (one fsync for the whole batch) instead of the
+    per-row overhead of DataFrame.to_sql
+    """
+    # name the columns explicitly so tables with a surrogate
+    # autoincrement key (e.g. plays.play_pk) accept data-only frames
+    columns = ','.join(df.columns)
+    placeholders = ','.join('?' * len(df.columns))
+    statement = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+    # nullable pandas dtypes surface missing values as pd.NA, which
+    # sqlite3 refuses to bind; convert them to plain None first
+    rows = df.astype(object).where(df.notna(), None)
+
+    with conn:
+        conn.executemany(statement, rows.itertuples(index=False, name=None))
+    return